@@ -0,0 +1,161 @@
+import os
+import json
+import queue
+import threading
+import pygame
+
+# --- Constants ---
+CAPTURE_ENV = "GONKWARE_CAPTURE"  # Output directory; capture is off when unset
+CAPTURE_FORMAT_ENV = "GONKWARE_CAPTURE_FORMAT"  # "png" (default) or "raw"
+RING_SIZE = 8
+WORKERS = 2
+DEFAULT_FPS = 60
+MAX_COPY_FAILURES = 30  # Consecutive failed copies before capture gives up
+
+tobytes = getattr(pygame.image, "tobytes", None) or pygame.image.tostring
+
+# --- Frame Capture ---
+class FrameCapture:
+    def __init__(self, out_dir, size, fmt="png", fps=DEFAULT_FPS, ring_size=RING_SIZE, workers=WORKERS):
+        self.out_dir = out_dir
+        self.size = size  # Every frame is stored at this size, even if the window is resized
+        self.fmt = fmt
+        self.fps = fps
+        self.presented = 0  # Index of the next presented frame, counting drops
+        self.captured = 0
+        self.dropped = 0
+        self.dropped_frames = []  # Presented indices that were not recorded
+        self.frame_log = []  # (presented index, ticks ms) for each recorded frame, in output order
+        self.copy_failures = 0  # Consecutive; reset by a successful copy
+        self.copy_error_logged = False
+        self.disabled = False
+        os.makedirs(out_dir, exist_ok=True)
+
+        # Reusable frame surfaces; a slot is either free or waiting to be encoded
+        self.slots = [pygame.Surface(size) for _ in range(ring_size)]
+        self.free = queue.Queue()
+        for i in range(ring_size):
+            self.free.put(i)
+        self.pending = queue.Queue()
+
+        self.raw_file = None
+        if fmt == "raw":
+            # Frames go into one file, so a single worker keeps them in order
+            self.raw_file = open(os.path.join(out_dir, "capture.rgb"), "wb")
+            workers = 1
+        self.workers = [threading.Thread(target=self.encode_loop, daemon=True) for _ in range(workers)]
+        for worker in self.workers:
+            worker.start()
+
+    def capture(self, surface):
+        """Copy the presented frame into a free slot, dropping it if none are free."""
+        index = self.presented
+        self.presented += 1
+        if self.disabled:
+            self.drop(index)
+            return
+        try:
+            slot = self.free.get_nowait()
+        except queue.Empty:
+            self.drop(index)  # Encoders are behind; never block the game loop
+            return
+        try:
+            frame = self.slots[slot]
+            if surface.get_size() == self.size:
+                frame.blit(surface, (0, 0))
+            else:
+                pygame.transform.scale(surface, self.size, frame)
+        except Exception as e:
+            self.free.put(slot)
+            self.drop(index)
+            self.copy_failed(e)
+            return
+        self.copy_failures = 0
+        self.frame_log.append((index, pygame.time.get_ticks()))
+        self.pending.put((slot, index))
+        self.captured += 1
+
+    def drop(self, index):
+        self.dropped += 1
+        self.dropped_frames.append(index)
+
+    def copy_failed(self, error):
+        """Log the first failed copy and disable capture if they keep failing."""
+        self.copy_failures += 1
+        if not self.copy_error_logged:
+            self.copy_error_logged = True
+            print("Frame copy failed:", error)
+        if self.copy_failures >= MAX_COPY_FAILURES:
+            self.disabled = True
+            print(f"Capture disabled after {self.copy_failures} failed frame copies; later frames count as dropped")
+
+    def encode_loop(self):
+        while True:
+            job = self.pending.get()
+            if job is None:
+                break
+            slot, index = job
+            frame = self.slots[slot]
+            try:
+                if self.raw_file:
+                    self.raw_file.write(tobytes(frame, "RGB"))
+                else:
+                    pygame.image.save(frame, os.path.join(self.out_dir, f"frame_{index:06d}.png"))
+            except Exception as e:
+                print("Frame encode failed:", e)
+            self.free.put(slot)
+
+    def write_metadata(self):
+        """Write capture.json so the frames can be decoded and retimed."""
+        width, height = self.size
+        metadata = {
+            "format": self.fmt,
+            "pixel_format": "rgb24" if self.fmt == "raw" else "png",
+            "width": width,
+            "height": height,
+            "fps": self.fps,
+            "presented": self.presented,
+            "captured": self.captured,
+            "dropped": self.dropped,
+            "dropped_frames": self.dropped_frames,
+            "disabled": self.disabled,
+            "frames": [{"index": index, "ticks_ms": ticks} for index, ticks in self.frame_log],
+        }
+        with open(os.path.join(self.out_dir, "capture.json"), "w") as f:
+            json.dump(metadata, f, indent=2)
+
+    def stop(self):
+        """Finish encoding queued frames and report capture stats."""
+        for _ in self.workers:
+            self.pending.put(None)
+        for worker in self.workers:
+            worker.join()
+        if self.raw_file:
+            self.raw_file.close()
+        self.write_metadata()
+        print(f"Capture: {self.captured} frames captured, {self.dropped} dropped")
+        return self.captured, self.dropped
+
+# --- Module Hooks ---
+active = None
+
+def start(fps=DEFAULT_FPS):
+    """Start capturing at the current window size if GONKWARE_CAPTURE points at an output directory."""
+    global active
+    out_dir = os.environ.get(CAPTURE_ENV)
+    if out_dir and active is None:
+        size = pygame.display.get_surface().get_size()
+        active = FrameCapture(out_dir, size, os.environ.get(CAPTURE_FORMAT_ENV, "png"), fps)
+    return active
+
+def flip():
+    """Present the display, copying the frame when capture is on."""
+    pygame.display.flip()
+    if active:
+        active.capture(pygame.display.get_surface())
+
+def stop():
+    global active
+    if active:
+        active.stop()
+        active = None
@@ -1,8 +1,8 @@
 import pygame
 import sys
 import math
-import importlib
-import random
+import capture
+from registry import MiniGameRegistry
 
 # --- Initialization ---
 pygame.init()
@@ -342,8 +342,10 @@ def main():
     last_time = pygame.time.get_ticks() / 1000.0
     scroll_offset = 0
 
-    # Lazy import minigames when needed
-    minigames_module = None
+    # Minigames are imported lazily by the registry when first scheduled
+    registry = MiniGameRegistry()
+    minigame_font = pygame.font.Font("assets/font/PhillySans.ttf", 32)
+    capture.start(FPS)
 
     while running:
         now = pygame.time.get_ticks() / 1000.0
@@ -361,19 +363,15 @@ def main():
                 result = menu.handle_event(event)
                 if result == 0:
                     # --- Start Game: Load and run minigames ---
-                    if minigames_module is None:
-                        minigames_module = importlib.import_module("minigames")
-                    # List of minigame constructors
-                    minigame_types = [
-                        lambda: minigames_module.TriviaMiniGame(screen, pygame.font.Font("assets/font/PhillySans.ttf", 32), "history"),
-                        lambda: minigames_module.MathMiniGame(screen, pygame.font.Font("assets/font/PhillySans.ttf", 32)),
-                        lambda: minigames_module.TypingMiniGame(screen, pygame.font.Font("assets/font/PhillySans.ttf", 32)),
-                        lambda: minigames_module.ScienceTFMiniGame(screen, pygame.font.Font("assets/font/PhillySans.ttf", 32)),
-                        lambda: minigames_module.GeographyFlagMiniGame(screen, pygame.font.Font("assets/font/PhillySans.ttf", 32)),
-                    ]
-                    random.shuffle(minigame_types)
-                    for mg_func in minigame_types:
-                        mg = mg_func()
+                    played = 0
+                    for entry in registry.schedule():
+                        mg = registry.create(entry, screen, minigame_font)
+                        if mg is None:
+                            continue
+                        if getattr(mg, "network_failed", False):
+                            registry.mark_offline()
+                            continue  # Skip it rather than play a question that never loaded
+                        played += 1
                         result = mg.run()
                         # Show result for a moment
                         screen.fill((0, 180, 0) if result else (180, 0, 0))
@@ -381,14 +379,22 @@ def main():
                             "Success!" if result else "Failed!", True, WHITE
                         )
                         screen.blit(msg, (screen.get_width() // 2 - msg.get_width() // 2, screen.get_height() // 2 - msg.get_height() // 2))
-                        pygame.display.flip()
+                        capture.flip()
                         pygame.time.wait(1200)
                         if not result:
                             break  # End game on first fail (Warioware style)
+                    if not played:
+                        print("No minigames available to play")
+                        screen.fill(DARK_GRAY)
+                        msg = minigame_font.render("No minigames available!", True, WHITE)
+                        screen.blit(msg, (screen.get_width() // 2 - msg.get_width() // 2, screen.get_height() // 2 - msg.get_height() // 2))
+                        capture.flip()
+                        pygame.time.wait(1200)
                     state = "main"
                 elif result == 1:
                     state = "settings"
                 elif result == 2:
+                    capture.stop()
                     pygame.quit()
                     sys.exit()
             elif state == "settings":
@@ -401,9 +407,10 @@ def main():
         elif state == "settings":
             scroll_offset = settings_menu.draw(dt, scroll_offset)
 
-        pygame.display.flip()
+        capture.flip()
         clock.tick(FPS)
 
+    capture.stop()
     pygame.quit()
     sys.exit()
 
@@ -1,8 +1,8 @@
 import pygame
-import requests
 import random
 import html
 import time
+import capture
 
 # --- Constants ---
 BASE_WIDTH, BASE_HEIGHT = 800, 600
@@ -38,6 +38,7 @@ def fetch_trivia(subject, difficulty="medium", qtype="multiple"):
         "type": qtype
     }
     try:
+        import requests  # Only network minigames pay for this import
         resp = requests.get(TRIVIA_API, params=params, timeout=3)
         data = resp.json()
         if data["response_code"] == 0:
@@ -63,6 +64,7 @@ class MiniGameBase:
         self.screen = screen
         self.font = font
         self.result = None  # None = running, True = win, False = lose
+        self.network_failed = False  # Set by minigames whose network fetch failed
 
     def run(self, time_limit=6):
         """Run the minigame for up to time_limit seconds."""
@@ -71,11 +73,12 @@ class MiniGameBase:
         while self.result is None and (time.time() - start) < time_limit:
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
+                    capture.stop()
                     pygame.quit()
                     exit()
                 self.handle_event(event)
             self.draw(time_limit - (time.time() - start))
-            pygame.display.flip()
+            capture.flip()
             clock.tick(60)
         if self.result is None:
             self.result = False  # Time out = lose
@@ -92,6 +95,7 @@ class TriviaMiniGame(MiniGameBase):
     def __init__(self, screen, font, subject):
         super().__init__(screen, font)
         self.trivia = fetch_trivia(subject)
+        self.network_failed = self.trivia is None
         self.selected = 0
 
     def handle_event(self, event):
@@ -190,6 +194,7 @@ class ScienceTFMiniGame(MiniGameBase):
     def __init__(self, screen, font):
         super().__init__(screen, font)
         self.trivia = fetch_trivia("science", qtype="boolean")
+        self.network_failed = self.trivia is None
         self.selected = 0  # 0 = True, 1 = False
 
     def handle_event(self, event):
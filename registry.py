@@ -0,0 +1,136 @@
+import json
+import time
+import random
+import socket
+import threading
+import importlib
+
+# --- Constants ---
+MANIFEST_PATH = "minigames.json"
+NETWORK_CHECK_HOST = "opentdb.com"
+NETWORK_CHECK_PORT = 443
+NETWORK_CHECK_TIMEOUT = 0.5
+NETWORK_CHECK_TTL = 30  # Seconds before the last result is re-checked
+
+# --- Utility ---
+def is_online(host=NETWORK_CHECK_HOST, port=NETWORK_CHECK_PORT, timeout=NETWORK_CHECK_TIMEOUT):
+    """Reachability check; blocking (DNS is unbounded), so only call it off the UI thread."""
+    try:
+        with socket.create_connection((host, port), timeout=timeout):
+            return True
+    except OSError:
+        return False
+
+# --- Minigame Registry ---
+class MiniGameEntry:
+    def __init__(self, name, module, weight=1, needs_network=False, args=None):
+        self.name = name
+        self.module = module
+        self.weight = weight
+        self.needs_network = needs_network
+        self.args = args or []
+
+    @classmethod
+    def from_manifest(cls, item):
+        """Build an entry from the known manifest fields, raising on bad values."""
+        name, module = item["name"], item["module"]
+        for field, value in (("name", name), ("module", module)):
+            if not isinstance(value, str) or not value:
+                raise ValueError(f"{field} must be a non-empty string, got {value!r}")
+        needs_network = item.get("needs_network", False)
+        if not isinstance(needs_network, bool):
+            raise ValueError(f"needs_network must be true or false, got {needs_network!r}")
+        args = item.get("args", [])
+        if not isinstance(args, list):
+            raise ValueError(f"args must be a list, got {args!r}")
+        return cls(name, module, float(item.get("weight", 1)), needs_network, args)
+
+class MiniGameRegistry:
+    def __init__(self, manifest_path=MANIFEST_PATH):
+        self.entries = self.load_manifest(manifest_path)
+        self.classes = {}  # (module, name) -> imported class
+        self.online = False  # Assume offline until the background probe says otherwise
+        self.checked_at = None
+        self.network_generation = 0  # Bumped by mark_offline so in-flight probes can't undo it
+        self.network_lock = threading.Lock()
+        self.probe = None
+        self.refresh_network()
+
+    def load_manifest(self, path):
+        """Read minigame entries from the manifest without importing any game code."""
+        try:
+            with open(path) as f:
+                data = json.load(f)
+        except Exception as e:
+            print("Could not load minigame manifest:", e)
+            return []
+        if not isinstance(data, list):
+            print("Could not load minigame manifest: expected a list of entries")
+            return []
+        entries = []
+        for item in data:
+            try:
+                entry = MiniGameEntry.from_manifest(item)
+            except (TypeError, ValueError, KeyError, AttributeError) as e:
+                print("Could not load minigame entry:", item, e)
+                continue
+            if entry.weight > 0:
+                entries.append(entry)
+        return entries
+
+    # --- Network Status ---
+    def refresh_network(self):
+        """Start a background probe if the last result is stale; never blocks."""
+        if not any(e.needs_network for e in self.entries):
+            return
+        if self.probe and self.probe.is_alive():
+            return
+        if self.checked_at is not None and time.time() - self.checked_at < NETWORK_CHECK_TTL:
+            return
+        self.probe = threading.Thread(target=self.run_probe, daemon=True)
+        self.probe.start()
+
+    def run_probe(self):
+        generation = self.network_generation
+        online = is_online()
+        with self.network_lock:
+            if generation != self.network_generation:
+                return  # A fetch failed while probing; that result wins
+            self.online = online
+            self.checked_at = time.time()
+
+    def mark_offline(self):
+        """Record a failed network fetch so later rounds skip network games."""
+        with self.network_lock:
+            self.network_generation += 1
+            self.online = False
+            self.checked_at = time.time()
+
+    def schedule(self):
+        """Yield playable entries in weighted random order, re-checking network status per entry."""
+        self.refresh_network()
+        # Weighted shuffle: higher weights tend to come first
+        entries = sorted(self.entries, key=lambda e: random.random() ** (1.0 / e.weight), reverse=True)
+        for entry in entries:
+            if entry.needs_network and not self.online:
+                continue
+            yield entry
+
+    def get_class(self, entry):
+        """Import the entry's module on first use and cache the minigame class."""
+        key = (entry.module, entry.name)
+        if key not in self.classes:
+            module = importlib.import_module(entry.module)
+            self.classes[key] = getattr(module, entry.name)
+        return self.classes[key]
+
+    def create(self, entry, screen, font):
+        """Instantiate the entry's minigame, or drop the entry and return None if it can't be imported."""
+        try:
+            cls = self.get_class(entry)
+        except (ImportError, AttributeError) as e:
+            print("Could not load minigame:", entry.name, e)
+            if entry in self.entries:
+                self.entries.remove(entry)
+            return None
+        return cls(screen, font, *entry.args)